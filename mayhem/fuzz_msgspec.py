@@ -5,25 +5,19 @@ import sys
 
 with atheris.instrument_imports():
     import msgspec
-    from typing import Optional, Set
+
+
+class User(msgspec.Struct):
+    name: str
 
 
 @atheris.instrument_func
 def test_input(input_bytes):
     fdp = atheris.FuzzedDataProvider(input_bytes)
     input_string = fdp.ConsumeUnicodeNoSurrogates(sys.maxsize)
-    input_str_w_surrogates = fdp.ConsumeUnicode(sys.maxsize)
-    input_int = fdp.ConsumeInt(sys.maxsize)
-    
+
     try:
-        class User(msgspec.Struct):
-            name: str
-            # groups: Set[str] = set()
-            # email: Optional[str] = None
-
-        alice = User(input_string)
-        # msg = msgspec.json.encode(alice)
-        # msgspec.json.decode(msg, type=User)
+        User(input_string)
     except msgspec.ValidationError:
         pass
     except TypeError:
@@ -3,6 +3,7 @@ import enum
 import re
 import sys
 import uuid
+import weakref
 from typing import Any, Union, Literal, List, Tuple, Dict, Set, FrozenSet
 
 if sys.version_info >= (3, 9):
@@ -15,6 +16,11 @@ try:
 except Exception:
     UnionType = None
 
+try:
+    from types import GenericAlias
+except Exception:
+    GenericAlias = None
+
 try:
     from typing_extensions import _AnnotatedAlias
 except Exception:
@@ -105,6 +111,11 @@ def schema(type: Any) -> Dict[str, Any]:
     If you want to generate schemas for multiple types, or to have more control
     over the generated schema you may want to use ``schema_components`` instead.
 
+    Schemas for classes are cached after their first generation. Changes made
+    to a class afterwards (e.g. reassigning ``__doc__``) won't be reflected in
+    later calls to ``schema``; ``schema_components`` always generates schemas
+    from scratch.
+
     Parameters
     ----------
     type : Type
@@ -119,6 +130,30 @@ def schema(type: Any) -> Dict[str, Any]:
     --------
     schema_components
     """
+    return _cached_schema(type)
+
+
+# Cache of `schema` results for classes. Keyed weakly so that caching a schema
+# never keeps a class alive.
+_schema_cache = weakref.WeakKeyDictionary()
+
+
+def _cached_schema(t):
+    if type(t) is GenericAlias or not isinstance(t, type):
+        # Only classes are cached. Other types (e.g. ``Union[int, str]`` and
+        # ``Union[str, int]``) may compare equal yet generate different schemas.
+        # Builtin generic aliases (e.g. ``list[int]``) are excluded explicitly,
+        # since on Python 3.9 and 3.10 they pass ``isinstance(t, type)``.
+        return _schema(t)
+    try:
+        out = _schema_cache[t]
+    except KeyError:
+        out = _schema_cache[t] = _schema(t)
+    # Copy the cached result so callers are free to mutate it
+    return json_clone(out)
+
+
+def _schema(type):
     (out,), components = schema_components((type,))
     if components:
         out["$defs"] = components
@@ -166,22 +201,42 @@ def roundtrip_json(d):
     return json_decode(json_encode(d))
 
 
+def json_clone(x):
+    """Deep copy a JSON-like object composed of dicts, lists, and scalars.
+
+    This is much faster than ``copy.deepcopy`` for JSON trees."""
+    t = type(x)
+    if t is dict:
+        return {k: json_clone(v) for k, v in x.items()}
+    elif t is list:
+        return [json_clone(v) for v in x]
+    return x
+
+
 def merge_json(a, b):
-    if b:
-        a = a.copy()
-        for key, b_val in b.items():
-            if key in a:
-                a_val = a[key]
-                if isinstance(a_val, dict) and isinstance(b_val, dict):
-                    a[key] = merge_json(a_val, b_val)
-                elif isinstance(a_val, (list, tuple)) and isinstance(
-                    b_val, (list, tuple)
-                ):
-                    a[key] = list(a_val) + list(b_val)
-                else:
-                    a[key] = b_val
-            else:
-                a[key] = b_val
+    """Merge two JSON-like objects.
+
+    Returns ``a`` unchanged if ``b`` is empty, otherwise a shallow-copied
+    merge; values from ``b`` are not copied. Nested dicts are merged
+    recursively, lists are concatenated, and all other values in ``b``
+    override those in ``a``. Neither input is mutated.
+
+    Note that JIT compilers like Numba aren't applicable here, since this
+    operates on heterogeneous Python objects. This is only used to apply
+    ``Meta(extra_json_schema=...)`` overrides, and isn't a hot path."""
+    if not b:
+        return a
+    a = a.copy()
+    for key, b_val in b.items():
+        if key in a:
+            a_val = a[key]
+            a_type = type(a_val)
+            b_type = type(b_val)
+            if a_type is dict and b_type is dict:
+                b_val = merge_json(a_val, b_val)
+            elif a_type in (list, tuple) and b_type in (list, tuple):
+                b_val = [*a_val, *b_val]
+        a[key] = b_val
     return a
 
 
@@ -255,7 +310,52 @@ def origin_args_metadata(t):
     return t, args, metadata
 
 
+# Schemas for types that map directly to a fixed JSON Schema. These are only
+# ever used to update a fresh schema dict, and must never be mutated.
+_PRIMITIVE_SCHEMAS = {
+    None: {"type": "null"},
+    type(None): {"type": "null"},
+    bool: {"type": "boolean"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    str: {"type": "string"},
+    bytes: {"type": "string", "contentEncoding": "base64"},
+    bytearray: {"type": "string", "contentEncoding": "base64"},
+    # When possible, format is set in _process_metadata
+    datetime.datetime: {"type": "string"},
+    # When possible, format is set in _process_metadata
+    datetime.time: {"type": "string"},
+    datetime.date: {"type": "string", "format": "date"},
+    uuid.UUID: {"type": "string", "format": "uuid"},
+}
+
+
+# Cache of sorted member values per enum type
+_enum_values_cache = weakref.WeakKeyDictionary()
+
+
+def _sorted_enum_values(t):
+    """A cached version of ``tuple(sorted(e.value for e in t))``"""
+    try:
+        return _enum_values_cache[t]
+    except KeyError:
+        out = _enum_values_cache[t] = tuple(sorted(e.value for e in t))
+        return out
+
+
 class SchemaBuilder:
+    __slots__ = (
+        "types",
+        "ref_template",
+        "type_hints",
+        "structs",
+        "enums",
+        "typeddicts",
+        "dataclasses",
+        "namedtuples",
+        "subtype_names",
+    )
+
     def __init__(self, types, ref_template):
         self.types = tuple(types)
         self.ref_template = ref_template
@@ -290,7 +390,10 @@ class SchemaBuilder:
         # First construct a decoder to validate the types are valid
         from ._core import JSONDecoder
 
-        JSONDecoder(Tuple[self.types])
+        # Each type is checked separately, rather than as a `Tuple[...]`, to
+        # avoid typing's cache of subscripted aliases keeping the types alive
+        for t in self.types:
+            JSONDecoder(t)
 
         for t in self.types:
             self._collect_type(t)
@@ -428,31 +531,8 @@ class SchemaBuilder:
 
         if t in (Any, Raw):
             pass
-        elif t is None or t is type(None):
-            schema["type"] = "null"
-        elif t is bool:
-            schema["type"] = "boolean"
-        elif t is int:
-            schema["type"] = "integer"
-        elif t is float:
-            schema["type"] = "number"
-        elif t is str:
-            schema["type"] = "string"
-        elif t in (bytes, bytearray):
-            schema["type"] = "string"
-            schema["contentEncoding"] = "base64"
-        elif t is datetime.datetime:
-            # When possible, format is set in _process_metadata
-            schema["type"] = "string"
-        elif t is datetime.time:
-            # When possible, format is set in _process_metadata
-            schema["type"] = "string"
-        elif t is datetime.date:
-            schema["type"] = "string"
-            schema["format"] = "date"
-        elif t is uuid.UUID:
-            schema["type"] = "string"
-            schema["format"] = "uuid"
+        elif (primitive := _PRIMITIVE_SCHEMAS.get(t)) is not None:
+            schema.update(primitive)
         elif t in (list, set, frozenset):
             schema["type"] = "array"
             if args:
@@ -517,7 +597,7 @@ class SchemaBuilder:
             schema.setdefault("title", t.__name__)
             if has_nondefault_docstring(t):
                 schema.setdefault("description", t.__doc__)
-            schema["enum"] = sorted(e.value for e in t)
+            schema["enum"] = list(_sorted_enum_values(t))
         elif is_struct(t):
             schema.setdefault("title", t.__name__)
             if has_nondefault_docstring(t):
@@ -1,9 +1,10 @@
 import enum
 import datetime
+import gc
 import decimal
 import uuid
+import weakref
 from base64 import b64encode
-from copy import deepcopy
 from collections import namedtuple
 from dataclasses import dataclass, field
 from typing import (
@@ -23,7 +24,7 @@ import pytest
 
 import msgspec
 from msgspec import Meta
-from msgspec._utils import merge_json
+from msgspec._utils import merge_json, json_clone
 
 from utils import temp_module
 
@@ -48,17 +49,32 @@ except ImportError:
         ({"a": [1, 2]}, {"a": [3, 4]}, {"a": [1, 2, 3, 4]}),
         ({"a": {"b": 1}}, {"a2": 3}, {"a": {"b": 1}, "a2": 3}),
         ({"a": 1}, {}, {"a": 1}),
+        ({}, {"a": {"b": 1}}, {"a": {"b": 1}}),
+        ({"a": {"b": 1}}, {"a": {}}, {"a": {"b": 1}}),
+        ({"a": 1, "b": 2}, {"c": 3, "d": 4}, {"a": 1, "b": 2, "c": 3, "d": 4}),
     ],
 )
 def test_merge_json(a, b, sol):
-    a_orig = deepcopy(a)
-    b_orig = deepcopy(b)
+    a_orig = json_clone(a)
+    b_orig = json_clone(b)
     res = merge_json(a, b)
     assert res == sol
+    assert list(res) == list(sol)
     assert a == a_orig
     assert b == b_orig
 
 
+def test_json_clone():
+    x = {"a": [1, {"b": [2.5, "c", None, True]}], "d": {"e": {}}}
+    res = json_clone(x)
+    assert res == x
+    assert res is not x
+    assert res["a"] is not x["a"]
+    assert res["a"][1] is not x["a"][1]
+    assert res["a"][1]["b"] is not x["a"][1]["b"]
+    assert res["d"]["e"] is not x["d"]["e"]
+
+
 def type_index(typ, args):
     try:
         return typ[args]
@@ -66,6 +82,80 @@ def type_index(typ, args):
         pytest.skip("Not supported in Python 3.8")
 
 
+def test_schema_cached_results_are_copies():
+    class Ex(msgspec.Struct):
+        x: List[int]
+
+    s1 = msgspec.json.schema(Ex)
+    s1["$defs"]["Ex"]["properties"]["x"]["items"]["type"] = "string"
+    s2 = msgspec.json.schema(Ex)
+    assert s2["$defs"]["Ex"]["properties"]["x"]["items"] == {"type": "integer"}
+
+
+def test_schema_cache_does_not_keep_types_alive():
+    class Ex(msgspec.Struct):
+        x: List[int]
+
+    msgspec.json.schema(Ex)
+    ref = weakref.ref(Ex)
+    del Ex
+    gc.collect()
+    assert ref() is None
+
+
+def test_schema_does_not_keep_recursive_types_alive():
+    source = """
+    from __future__ import annotations
+    import msgspec
+
+    class A(msgspec.Struct):
+        b: B | None = None
+
+    class B(msgspec.Struct):
+        a: A | None = None
+    """
+    with temp_module(source) as mod:
+        try:
+            msgspec.json.schema(mod.A)
+        except TypeError:
+            pytest.skip("Union operator not supported")
+        refs = [weakref.ref(mod.A), weakref.ref(mod.B)]
+    del mod
+    gc.collect()
+    assert all(r() is None for r in refs)
+
+
+def test_schema_does_not_keep_enums_alive():
+    class Ex(enum.Enum):
+        A = 1
+        B = 2
+
+    class Ex2(msgspec.Struct):
+        x: Ex
+
+    assert msgspec.json.schema(Ex2)["$defs"]["Ex"]["enum"] == [1, 2]
+    ref = weakref.ref(Ex)
+    del Ex, Ex2
+    gc.collect()
+    assert ref() is None
+
+
+def test_schema_cached_equal_unions_distinct():
+    s1 = msgspec.json.schema(Union[int, str])
+    s2 = msgspec.json.schema(Union[str, int])
+    assert s1 == {"anyOf": [{"type": "integer"}, {"type": "string"}]}
+    assert s2 == {"anyOf": [{"type": "string"}, {"type": "integer"}]}
+
+
+def test_schema_cached_equal_generic_aliases_distinct():
+    # Hold a reference to the first alias so it stays in any weak cache
+    a1 = type_index(list, Union[int, str])
+    s1 = msgspec.json.schema(a1)
+    s2 = msgspec.json.schema(type_index(list, Union[str, int]))
+    assert s1["items"] == {"anyOf": [{"type": "integer"}, {"type": "string"}]}
+    assert s2["items"] == {"anyOf": [{"type": "string"}, {"type": "integer"}]}
+
+
 def test_any():
     assert msgspec.json.schema(Any) == {}
 